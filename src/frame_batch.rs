@@ -0,0 +1,626 @@
+//! Struct-of-arrays storage for call stacks.
+//! Each frame attribute lives in its own column so merge and scan loops walk tight vectors
+//! instead of hopping between per-frame enum values. Instruction pointers are parsed to
+//! `u64` once on the way in, so comparisons and hashing never touch hex text.
+
+use std::fmt;
+use std::hash::{Hash, Hasher};
+use std::sync::Arc;
+
+use rustc_hash::FxHasher;
+
+use crate::frame_cache::{CachedFrame, FrameCache};
+use crate::symbols::{self, SymbolId};
+use crate::{write_frame, CallFrame};
+
+/// Parse a collector-reported instruction pointer such as `"0xdeadbeef"`.
+///
+/// Accepts an optional `0x`/`0X` prefix; unparsable text maps to 0, the same value used
+/// for frames without a meaningful ip.
+pub fn parse_ip(ip: &str) -> u64 {
+    let digits = ip
+        .strip_prefix("0x")
+        .or_else(|| ip.strip_prefix("0X"))
+        .unwrap_or(ip);
+    u64::from_str_radix(digits, 16).unwrap_or(0)
+}
+
+/// Which side of the mixed stack a frame came from.
+///
+/// One byte with fixed discriminants, so the `kinds` column can be handed to consumers
+/// outside Rust as plain `u8`s and dispatch is a `match`, never a string compare.
+#[derive(Clone, Copy, Debug, PartialEq, Eq, Hash)]
+#[repr(u8)]
+pub enum FrameKind {
+    CFrame = 0,
+    PyFrame = 1,
+}
+
+impl FrameKind {
+    /// Display name, matching the [`CallFrame`] variant.
+    pub fn name(self) -> &'static str {
+        match self {
+            FrameKind::CFrame => "CFrame",
+            FrameKind::PyFrame => "PyFrame",
+        }
+    }
+}
+
+/// A stack of frames stored column-wise; row `i` across all columns is one frame.
+///
+/// File and function names are stored as ids into the process-wide symbol table (see
+/// [`crate::symbols`]), so copying a row into another batch (e.g. while merging) is a
+/// plain integer copy. Whether each function is a Python interpreter boundary is looked up
+/// once at push time and kept in a side column, so the merge never consults the symbol
+/// table.
+#[derive(Clone, Debug, Default, PartialEq, Eq)]
+pub struct FrameBatch {
+    kinds: Vec<FrameKind>,
+    ips: Vec<u64>,
+    files: Vec<SymbolId>,
+    funcs: Vec<SymbolId>,
+    py_eval: Vec<bool>,
+    linenos: Vec<i64>,
+}
+
+impl FrameBatch {
+    pub fn new() -> Self {
+        Self::default()
+    }
+
+    pub fn with_capacity(capacity: usize) -> Self {
+        FrameBatch {
+            kinds: Vec::with_capacity(capacity),
+            ips: Vec::with_capacity(capacity),
+            files: Vec::with_capacity(capacity),
+            funcs: Vec::with_capacity(capacity),
+            py_eval: Vec::with_capacity(capacity),
+            linenos: Vec::with_capacity(capacity),
+        }
+    }
+
+    pub fn len(&self) -> usize {
+        self.kinds.len()
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.kinds.is_empty()
+    }
+
+    /// Number of frames the batch can hold without reallocating any column.
+    pub fn capacity(&self) -> usize {
+        self.kinds.capacity()
+    }
+
+    /// Append a native frame.
+    pub fn push_cframe(&mut self, ip: &str, file: &str, func: &str, lineno: i64) {
+        self.push(FrameKind::CFrame, ip, file, func, lineno);
+    }
+
+    /// Append a Python frame.
+    pub fn push_pyframe(&mut self, ip: &str, file: &str, func: &str, lineno: i64) {
+        self.push(FrameKind::PyFrame, ip, file, func, lineno);
+    }
+
+    /// Append many native frames given as parallel columns.
+    ///
+    /// Reserves every column once. Names already in the symbol table are resolved under a
+    /// single shared lock, so concurrent readers are not blocked; only if some names are new
+    /// is the exclusive lock taken, once, to intern those.
+    ///
+    /// # Panics
+    /// If the input columns differ in length.
+    pub fn extend_cframes<S: AsRef<str>>(
+        &mut self,
+        ips: &[S],
+        files: &[S],
+        funcs: &[S],
+        linenos: &[i64],
+    ) {
+        let n = ips.len();
+        assert!(
+            files.len() == n && funcs.len() == n && linenos.len() == n,
+            "column lengths differ"
+        );
+
+        let start = self.len();
+        self.kinds.resize(start + n, FrameKind::CFrame);
+        self.ips.extend(ips.iter().map(|ip| parse_ip(ip.as_ref())));
+        self.linenos.extend_from_slice(linenos);
+        self.files.reserve(n);
+        self.funcs.reserve(n);
+        self.py_eval.reserve(n);
+
+        let mut misses = Vec::new();
+        {
+            let table = symbols::reader();
+            for (i, (file, func)) in files.iter().zip(funcs).enumerate() {
+                match (table.get(file.as_ref()), table.get(func.as_ref())) {
+                    (Some(file), Some(func)) => {
+                        self.files.push(file);
+                        self.funcs.push(func);
+                        self.py_eval.push(table.is_py_eval(func));
+                    }
+                    _ => {
+                        // Placeholder, overwritten below under the exclusive lock.
+                        self.files.push(0);
+                        self.funcs.push(0);
+                        self.py_eval.push(false);
+                        misses.push(i);
+                    }
+                }
+            }
+        }
+
+        if !misses.is_empty() {
+            let mut table = symbols::writer();
+            for i in misses {
+                let func = table.intern(funcs[i].as_ref());
+                self.files[start + i] = table.intern(files[i].as_ref());
+                self.funcs[start + i] = func;
+                self.py_eval[start + i] = table.is_py_eval(func);
+            }
+        }
+    }
+
+    /// Append the native frame at `ip`, resolving `(file, func, lineno)` only if `cache`
+    /// has not seen `ip` before. An ip that does not parse (see [`parse_ip`]) is resolved
+    /// every time, since it cannot tell call sites apart.
+    pub fn push_cframe_cached<F>(&mut self, cache: &mut FrameCache, ip: &str, resolve: F)
+    where
+        F: FnOnce() -> (String, String, i64),
+    {
+        let ip = parse_ip(ip);
+        let frame = cache.native(ip, resolve);
+        self.push_resolved(FrameKind::CFrame, ip, frame);
+    }
+
+    /// Append the Python frame executing `code_id` (i.e. `id(code)`) at `lasti`,
+    /// resolving `(file, func, lineno)` only on a cache miss.
+    pub fn push_pyframe_cached<F>(
+        &mut self,
+        cache: &mut FrameCache,
+        code_id: u64,
+        lasti: i32,
+        resolve: F,
+    ) where
+        F: FnOnce() -> (String, String, i64),
+    {
+        let frame = cache.python(code_id, lasti, resolve);
+        self.push_resolved(FrameKind::PyFrame, 0, frame);
+    }
+
+    fn push(&mut self, kind: FrameKind, ip: &str, file: &str, func: &str, lineno: i64) {
+        let frame = CachedFrame::intern(file, func, lineno);
+        self.push_resolved(kind, parse_ip(ip), frame);
+    }
+
+    fn push_resolved(&mut self, kind: FrameKind, ip: u64, frame: CachedFrame) {
+        self.kinds.push(kind);
+        self.ips.push(ip);
+        self.files.push(frame.file);
+        self.funcs.push(frame.func);
+        self.py_eval.push(frame.py_eval);
+        self.linenos.push(frame.lineno);
+    }
+
+    /// Append rows `start..` of `other`, one bulk copy per column.
+    pub(crate) fn extend_from_rows(&mut self, other: &FrameBatch, start: usize) {
+        self.kinds.extend_from_slice(&other.kinds[start..]);
+        self.ips.extend_from_slice(&other.ips[start..]);
+        self.files.extend_from_slice(&other.files[start..]);
+        self.funcs.extend_from_slice(&other.funcs[start..]);
+        self.py_eval.extend_from_slice(&other.py_eval[start..]);
+        self.linenos.extend_from_slice(&other.linenos[start..]);
+    }
+
+    /// Overwrite row `dst` with row `src` of `other`.
+    pub(crate) fn set_row(&mut self, dst: usize, other: &FrameBatch, src: usize) {
+        self.kinds[dst] = other.kinds[src];
+        self.ips[dst] = other.ips[src];
+        self.files[dst] = other.files[src];
+        self.funcs[dst] = other.funcs[src];
+        self.py_eval[dst] = other.py_eval[src];
+        self.linenos[dst] = other.linenos[src];
+    }
+
+    /// Python interpreter boundary flag for each row's function.
+    pub(crate) fn py_eval_flags(&self) -> &[bool] {
+        &self.py_eval
+    }
+
+    /// Instruction pointer column.
+    pub fn ips(&self) -> &[u64] {
+        &self.ips
+    }
+
+    /// Frame kind column.
+    pub fn kinds(&self) -> &[FrameKind] {
+        &self.kinds
+    }
+
+    /// File symbol id column; ids are dense indices into the symbol table.
+    pub fn file_ids(&self) -> &[SymbolId] {
+        &self.files
+    }
+
+    /// Function symbol id column; ids are dense indices into the symbol table.
+    pub fn func_ids(&self) -> &[SymbolId] {
+        &self.funcs
+    }
+
+    /// Line number column.
+    pub fn linenos(&self) -> &[i64] {
+        &self.linenos
+    }
+
+    /// 64-bit hash of the stack's kinds, ips, symbols and line numbers, computed in one pass.
+    ///
+    /// Equal batches always have equal fingerprints; see [`crate::StackTable`] for
+    /// deduplication built on it.
+    pub fn fingerprint(&self) -> u64 {
+        let mut hasher = FxHasher::default();
+        self.kinds.hash(&mut hasher);
+        self.ips.hash(&mut hasher);
+        self.files.hash(&mut hasher);
+        self.funcs.hash(&mut hasher);
+        self.linenos.hash(&mut hasher);
+        hasher.finish()
+    }
+
+    /// Borrowed, read-only view of row `i`.
+    pub fn get(&self, i: usize) -> FrameRef<'_> {
+        assert!(i < self.len(), "frame index {i} out of range");
+        FrameRef {
+            batch: self,
+            row: i,
+        }
+    }
+
+    /// Iterate rows as [`FrameRef`] views.
+    pub fn iter(&self) -> impl ExactSizeIterator<Item = FrameRef<'_>> {
+        (0..self.len()).map(move |row| FrameRef { batch: self, row })
+    }
+
+    pub fn kind(&self, i: usize) -> FrameKind {
+        self.kinds[i]
+    }
+
+    pub fn ip(&self, i: usize) -> u64 {
+        self.ips[i]
+    }
+
+    pub fn file(&self, i: usize) -> Arc<str> {
+        symbols::resolve(self.files[i])
+    }
+
+    pub fn func(&self, i: usize) -> Arc<str> {
+        symbols::resolve(self.funcs[i])
+    }
+
+    pub fn file_id(&self, i: usize) -> SymbolId {
+        self.files[i]
+    }
+
+    pub fn func_id(&self, i: usize) -> SymbolId {
+        self.funcs[i]
+    }
+
+    pub fn lineno(&self, i: usize) -> i64 {
+        self.linenos[i]
+    }
+}
+
+impl<'a> FromIterator<&'a CallFrame> for FrameBatch {
+    fn from_iter<I: IntoIterator<Item = &'a CallFrame>>(iter: I) -> Self {
+        let iter = iter.into_iter();
+        let mut batch = FrameBatch::with_capacity(iter.size_hint().0);
+        for frame in iter {
+            match frame {
+                CallFrame::CFrame {
+                    ip,
+                    file,
+                    func,
+                    lineno,
+                } => batch.push_cframe(ip, file, func, *lineno),
+                CallFrame::PyFrame {
+                    ip,
+                    file,
+                    func,
+                    lineno,
+                } => batch.push_pyframe(ip, file, func, *lineno),
+            }
+        }
+        batch
+    }
+}
+
+/// One frame per line, in the same format as [`CallFrame`]'s `Display`.
+///
+/// Columns are zipped and the symbol table is read-locked once for the whole batch, instead
+/// of resolving each field through the per-row accessors.
+impl fmt::Display for FrameBatch {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        let table = symbols::reader();
+        let rows = self
+            .kinds
+            .iter()
+            .zip(&self.ips)
+            .zip(self.files.iter().zip(&self.funcs))
+            .zip(&self.linenos);
+        for (i, (((&kind, &ip), (&file, &func)), &lineno)) in rows.enumerate() {
+            if i > 0 {
+                f.write_str("\n")?;
+            }
+            let (file, func) = (table.resolve(file), table.resolve(func));
+            write_frame(f, kind, format_args!("{ip:#x}"), file, func, lineno)?;
+        }
+        Ok(())
+    }
+}
+
+/// Immutable view of one row of a [`FrameBatch`].
+///
+/// Two words wide and `Copy`; fields are read straight from the batch columns, so passing
+/// frames around never builds an owned [`CallFrame`] unless asked to.
+#[derive(Clone, Copy)]
+pub struct FrameRef<'a> {
+    batch: &'a FrameBatch,
+    row: usize,
+}
+
+/// Shows only this row's fields, not the whole batch it points into.
+impl fmt::Debug for FrameRef<'_> {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        f.debug_struct("FrameRef")
+            .field("kind", &self.kind())
+            .field("ip", &format_args!("{:#x}", self.ip()))
+            .field("file", &self.file())
+            .field("func", &self.func())
+            .field("lineno", &self.lineno())
+            .finish()
+    }
+}
+
+impl FrameRef<'_> {
+    pub fn kind(&self) -> FrameKind {
+        self.batch.kinds[self.row]
+    }
+
+    pub fn ip(&self) -> u64 {
+        self.batch.ips[self.row]
+    }
+
+    pub fn file(&self) -> Arc<str> {
+        symbols::resolve(self.file_id())
+    }
+
+    pub fn func(&self) -> Arc<str> {
+        symbols::resolve(self.func_id())
+    }
+
+    pub fn file_id(&self) -> SymbolId {
+        self.batch.files[self.row]
+    }
+
+    pub fn func_id(&self) -> SymbolId {
+        self.batch.funcs[self.row]
+    }
+
+    pub fn lineno(&self) -> i64 {
+        self.batch.linenos[self.row]
+    }
+
+    /// Materialize an owned [`CallFrame`] for this row.
+    pub fn to_call_frame(&self) -> CallFrame {
+        let ip = format!("{:#x}", self.ip());
+        let file = self.file().to_string();
+        let func = self.func().to_string();
+        let lineno = self.lineno();
+        match self.kind() {
+            FrameKind::CFrame => CallFrame::CFrame {
+                ip,
+                file,
+                func,
+                lineno,
+            },
+            FrameKind::PyFrame => CallFrame::PyFrame {
+                ip,
+                file,
+                func,
+                lineno,
+            },
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_push_and_read_rows() {
+        let mut batch = FrameBatch::new();
+        batch.push_cframe("0xdeadbeef", "libfoo.c", "foo", 12);
+        batch.push_pyframe("0x0", "app.py", "main", 3);
+
+        assert_eq!(batch.len(), 2);
+        assert_eq!(batch.kind(0), FrameKind::CFrame);
+        assert_eq!(batch.ip(0), 0xdeadbeef);
+        assert_eq!(&*batch.file(0), "libfoo.c");
+        assert_eq!(&*batch.func(0), "foo");
+        assert_eq!(batch.lineno(0), 12);
+        assert_eq!(batch.kind(1), FrameKind::PyFrame);
+        assert_eq!(&*batch.func(1), "main");
+    }
+
+    #[test]
+    fn test_repeated_names_share_ids() {
+        let mut batch = FrameBatch::new();
+        batch.push_cframe("0x1", "ceval.c", "PyEval_EvalFrameDefault", 0);
+        batch.push_cframe("0x2", "ceval.c", "PyEval_EvalFrameDefault", 0);
+
+        assert_eq!(batch.func_id(0), batch.func_id(1));
+        assert_eq!(batch.file_id(0), batch.file_id(1));
+    }
+
+    #[test]
+    fn test_extend_cframes_matches_push() {
+        let ips = ["0x1", "0x2", "0x3"];
+        let files = ["a.c", "a.c", "b.c"];
+        let funcs = ["extend_f", "PyEval_EvalFrameDefault", "extend_g"];
+        let linenos = [1, 2, 3];
+
+        // First call interns new names, the second finds them all already interned.
+        let mut bulk = FrameBatch::new();
+        bulk.extend_cframes(&ips, &files, &funcs, &linenos);
+        bulk.extend_cframes(&ips, &files, &funcs, &linenos);
+        let mut plain = FrameBatch::new();
+        for _ in 0..2 {
+            for i in 0..ips.len() {
+                plain.push_cframe(ips[i], files[i], funcs[i], linenos[i]);
+            }
+        }
+
+        assert_eq!(bulk, plain);
+    }
+
+    #[test]
+    #[should_panic(expected = "column lengths differ")]
+    fn test_extend_cframes_rejects_ragged_columns() {
+        FrameBatch::new().extend_cframes(&["0x1"], &["a.c"], &[], &[1]);
+    }
+
+    #[test]
+    fn test_cached_push_resolves_unparsable_ips() {
+        let mut cache = FrameCache::new();
+        let mut batch = FrameBatch::new();
+        batch.push_cframe_cached(&mut cache, "??", || {
+            ("a.c".to_string(), "foo".to_string(), 1)
+        });
+        batch.push_cframe_cached(&mut cache, "", || ("b.c".to_string(), "bar".to_string(), 2));
+
+        let mut plain = FrameBatch::new();
+        plain.push_cframe("??", "a.c", "foo", 1);
+        plain.push_cframe("", "b.c", "bar", 2);
+        assert_eq!(batch, plain);
+    }
+
+    #[test]
+    fn test_cached_push_matches_plain_push() {
+        let mut cache = FrameCache::new();
+        let mut cached = FrameBatch::new();
+        let mut plain = FrameBatch::new();
+        for _ in 0..3 {
+            cached.push_cframe_cached(&mut cache, "0xdeadbeef", || {
+                ("libfoo.c".to_string(), "foo".to_string(), 12)
+            });
+            plain.push_cframe("0xdeadbeef", "libfoo.c", "foo", 12);
+        }
+        cached.push_pyframe_cached(&mut cache, 42, 6, || {
+            ("app.py".to_string(), "main".to_string(), 3)
+        });
+        plain.push_pyframe("0x0", "app.py", "main", 3);
+
+        assert_eq!(cached, plain);
+    }
+
+    #[test]
+    fn test_frame_kind_is_one_byte() {
+        assert_eq!(std::mem::size_of::<FrameKind>(), 1);
+        assert_eq!(FrameKind::CFrame as u8, 0);
+        assert_eq!(FrameKind::PyFrame as u8, 1);
+    }
+
+    #[test]
+    fn test_parse_ip() {
+        assert_eq!(parse_ip("0xdeadbeef"), 0xdeadbeef);
+        assert_eq!(parse_ip("0XDEADBEEF"), 0xdeadbeef);
+        assert_eq!(parse_ip("7f00"), 0x7f00);
+        assert_eq!(parse_ip("0x0"), 0);
+        assert_eq!(parse_ip(""), 0);
+        assert_eq!(parse_ip("garbage"), 0);
+    }
+
+    #[test]
+    fn test_columns_are_contiguous_slices() {
+        let mut batch = FrameBatch::new();
+        batch.push_cframe("0x1", "a.c", "a", 10);
+        batch.push_pyframe("0x0", "b.py", "b", 20);
+        batch.push_cframe("0x2", "a.c", "a", 30);
+
+        assert_eq!(batch.ips(), &[0x1, 0x0, 0x2]);
+        assert_eq!(batch.linenos(), &[10, 20, 30]);
+        assert_eq!(
+            batch.kinds(),
+            &[FrameKind::CFrame, FrameKind::PyFrame, FrameKind::CFrame]
+        );
+        assert_eq!(batch.func_ids()[0], batch.func_ids()[2]);
+        assert_eq!(batch.file_ids()[1], symbols::intern("b.py"));
+    }
+
+    #[test]
+    fn test_fingerprint_tracks_content() {
+        let mut a = FrameBatch::new();
+        a.push_cframe("0x1", "a.c", "a", 10);
+        a.push_pyframe("0x0", "b.py", "b", 20);
+        let b = a.clone();
+        let mut c = a.clone();
+        c.push_cframe("0x2", "a.c", "a", 30);
+
+        assert_eq!(a.fingerprint(), b.fingerprint());
+        assert_ne!(a.fingerprint(), c.fingerprint());
+    }
+
+    #[test]
+    fn test_display_matches_call_frames() {
+        let mut batch = FrameBatch::new();
+        batch.push_cframe("0xdeadbeef", "libfoo.c", "foo", 12);
+        batch.push_pyframe("0x0", "app.py", "main", 3);
+
+        let expected: Vec<String> = batch
+            .iter()
+            .map(|frame| frame.to_call_frame().to_string())
+            .collect();
+
+        assert_eq!(batch.to_string(), expected.join("\n"));
+        assert_eq!(FrameBatch::new().to_string(), "");
+    }
+
+    #[test]
+    fn test_round_trip_call_frames() {
+        let frames = vec![
+            CallFrame::CFrame {
+                ip: "0xdeadbeef".to_string(),
+                file: "libfoo.c".to_string(),
+                func: "foo".to_string(),
+                lineno: 12,
+            },
+            CallFrame::PyFrame {
+                ip: "0x0".to_string(),
+                file: "app.py".to_string(),
+                func: "main".to_string(),
+                lineno: 3,
+            },
+        ];
+
+        let batch: FrameBatch = frames.iter().collect();
+        let back: Vec<CallFrame> = batch.iter().map(|f| f.to_call_frame()).collect();
+
+        assert_eq!(back, frames);
+        assert_eq!(batch.get(1).kind(), FrameKind::PyFrame);
+        assert_eq!(&*batch.get(1).func(), "main");
+    }
+
+    #[test]
+    fn test_frame_ref_debug_shows_only_its_row() {
+        let mut batch = FrameBatch::new();
+        batch.push_cframe("0x10", "a.c", "foo", 1);
+        batch.push_pyframe("0x0", "app.py", "main", 3);
+
+        assert_eq!(
+            format!("{:?}", batch.get(1)),
+            r#"FrameRef { kind: PyFrame, ip: 0x0, file: "app.py", func: "main", lineno: 3 }"#
+        );
+    }
+}
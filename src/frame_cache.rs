@@ -0,0 +1,164 @@
+//! Bounded cache of resolved frames keyed by call site.
+//! A sampling profiler sees the same call sites over and over; caching the resolved
+//! (file, func, lineno) ids lets recurring samples skip symbol resolution and interning.
+
+use std::hash::{Hash, Hasher};
+
+use rustc_hash::FxHasher;
+
+use crate::symbols::{self, SymbolId};
+
+/// Number of slots in a [`FrameCache`]; must be a power of two.
+pub const FRAME_CACHE_SLOTS: usize = 4096;
+
+/// Identity of a call site.
+#[derive(Clone, Copy, Debug, PartialEq, Eq, Hash)]
+enum CallSite {
+    /// Native frame, identified by its instruction pointer.
+    Native(u64),
+    /// Python frame, identified by `id(code)` and the last executed instruction.
+    Python { code_id: u64, lasti: i32 },
+}
+
+/// Interned ids for a resolved frame.
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+pub(crate) struct CachedFrame {
+    pub(crate) file: SymbolId,
+    pub(crate) func: SymbolId,
+    /// Whether `func` is a Python interpreter boundary.
+    pub(crate) py_eval: bool,
+    pub(crate) lineno: i64,
+}
+
+impl CachedFrame {
+    pub(crate) fn intern(file: &str, func: &str, lineno: i64) -> Self {
+        let (func, py_eval) = symbols::intern_func(func);
+        CachedFrame {
+            file: symbols::intern(file),
+            func,
+            py_eval,
+            lineno,
+        }
+    }
+}
+
+/// Direct-mapped frame cache with [`FRAME_CACHE_SLOTS`] entries.
+///
+/// Each call site hashes to one slot; a colliding site simply replaces the previous
+/// occupant. Cached frames are immutable, so eviction never needs invalidation.
+#[derive(Debug)]
+pub struct FrameCache {
+    slots: Box<[Option<(CallSite, CachedFrame)>]>,
+}
+
+impl Default for FrameCache {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+
+impl FrameCache {
+    pub fn new() -> Self {
+        FrameCache {
+            slots: vec![None; FRAME_CACHE_SLOTS].into_boxed_slice(),
+        }
+    }
+
+    /// Resolved ids for native frame `ip`, calling `resolve` for `(file, func, lineno)` on a miss.
+    ///
+    /// An ip of 0 stands for "unknown" (see [`crate::parse_ip`]) and does not identify a
+    /// call site, so such frames are always resolved and never cached.
+    pub(crate) fn native<F>(&mut self, ip: u64, resolve: F) -> CachedFrame
+    where
+        F: FnOnce() -> (String, String, i64),
+    {
+        if ip == 0 {
+            return intern_resolved(resolve);
+        }
+        self.lookup(CallSite::Native(ip), resolve)
+    }
+
+    /// Resolved ids for a Python frame at (`code_id`, `lasti`), calling `resolve` on a miss.
+    pub(crate) fn python<F>(&mut self, code_id: u64, lasti: i32, resolve: F) -> CachedFrame
+    where
+        F: FnOnce() -> (String, String, i64),
+    {
+        self.lookup(CallSite::Python { code_id, lasti }, resolve)
+    }
+
+    fn lookup<F>(&mut self, site: CallSite, resolve: F) -> CachedFrame
+    where
+        F: FnOnce() -> (String, String, i64),
+    {
+        let slot = slot_of(&site);
+        if let Some((cached_site, frame)) = &self.slots[slot] {
+            if *cached_site == site {
+                return *frame;
+            }
+        }
+        let frame = intern_resolved(resolve);
+        self.slots[slot] = Some((site, frame));
+        frame
+    }
+}
+
+fn intern_resolved<F>(resolve: F) -> CachedFrame
+where
+    F: FnOnce() -> (String, String, i64),
+{
+    let (file, func, lineno) = resolve();
+    CachedFrame::intern(&file, &func, lineno)
+}
+
+fn slot_of(site: &CallSite) -> usize {
+    let mut hasher = FxHasher::default();
+    site.hash(&mut hasher);
+    hasher.finish() as usize & (FRAME_CACHE_SLOTS - 1)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn resolved(func: &str) -> (String, String, i64) {
+        ("file.c".to_string(), func.to_string(), 7)
+    }
+
+    #[test]
+    fn test_native_hit_skips_resolve() {
+        let mut cache = FrameCache::new();
+        let first = cache.native(0xdeadbeef, || resolved("foo"));
+        let second = cache.native(0xdeadbeef, || panic!("resolved a cached ip"));
+
+        assert_eq!(first, second);
+        assert_eq!(&*symbols::resolve(second.func), "foo");
+    }
+
+    #[test]
+    fn test_unknown_ip_is_never_cached() {
+        let mut cache = FrameCache::new();
+        let first = cache.native(0, || resolved("foo"));
+        let second = cache.native(0, || resolved("bar"));
+
+        assert_ne!(first.func, second.func);
+    }
+
+    #[test]
+    fn test_python_sites_keyed_by_code_and_lasti() {
+        let mut cache = FrameCache::new();
+        let a = cache.python(1, 10, || resolved("a"));
+        let b = cache.python(1, 12, || resolved("b"));
+
+        assert_ne!(a.func, b.func);
+        assert_eq!(cache.python(1, 10, || panic!("resolved a cached site")), a);
+    }
+
+    #[test]
+    fn test_native_and_python_sites_do_not_alias() {
+        let mut cache = FrameCache::new();
+        let native = cache.native(1, || resolved("native"));
+        let python = cache.python(1, 0, || resolved("python"));
+
+        assert_ne!(native.func, python.func);
+    }
+}
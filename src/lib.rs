@@ -1,9 +1,19 @@
 //! mixed-stack-tracer: minimal crate exposing merge functionality for prototype/testing.
 
+use std::fmt;
+
+pub mod frame_batch;
+pub mod frame_cache;
+pub mod stack_table;
 pub mod stack_tracer;
+pub mod symbols;
 
 /// Public re-exports for convenience
+pub use crate::frame_batch::{parse_ip, FrameBatch, FrameKind, FrameRef};
+pub use crate::frame_cache::FrameCache;
+pub use crate::stack_table::{StackId, StackTable};
 pub use crate::stack_tracer::SignalTracer;
+pub use crate::symbols::SymbolId;
 
 /// A simple CallFrame model used in tests and examples.
 /// In real integration this would come from symbol resolution/demangling and probing_proto.
@@ -21,4 +31,110 @@ pub enum CallFrame {
         func: String,
         lineno: i64,
     },
-}
\ No newline at end of file
+}
+
+impl CallFrame {
+    /// Which side of the mixed stack this frame came from.
+    pub fn kind(&self) -> FrameKind {
+        match self {
+            CallFrame::CFrame { .. } => FrameKind::CFrame,
+            CallFrame::PyFrame { .. } => FrameKind::PyFrame,
+        }
+    }
+
+    /// Instruction pointer as reported by the collector (e.g. `"0x7f..."`).
+    pub fn ip(&self) -> &str {
+        match self {
+            CallFrame::CFrame { ip, .. } | CallFrame::PyFrame { ip, .. } => ip,
+        }
+    }
+
+    /// Source file, empty when unknown.
+    pub fn file(&self) -> &str {
+        match self {
+            CallFrame::CFrame { file, .. } | CallFrame::PyFrame { file, .. } => file,
+        }
+    }
+
+    /// Function (symbol) name.
+    pub fn func(&self) -> &str {
+        match self {
+            CallFrame::CFrame { func, .. } | CallFrame::PyFrame { func, .. } => func,
+        }
+    }
+
+    /// Line number, 0 when unknown.
+    pub fn lineno(&self) -> i64 {
+        match self {
+            CallFrame::CFrame { lineno, .. } | CallFrame::PyFrame { lineno, .. } => *lineno,
+        }
+    }
+}
+
+/// One-line rendering, e.g. `CFrame foo at libfoo.c:12 (0xdeadbeef)` or `PyFrame main at app.py:3`.
+///
+/// Fields are written straight into the formatter; no intermediate strings are built.
+impl fmt::Display for CallFrame {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        write_frame(
+            f,
+            self.kind(),
+            self.ip(),
+            self.file(),
+            self.func(),
+            self.lineno(),
+        )
+    }
+}
+
+/// Shared one-line frame rendering for [`CallFrame`] and [`FrameBatch`].
+pub(crate) fn write_frame(
+    f: &mut fmt::Formatter<'_>,
+    kind: FrameKind,
+    ip: impl fmt::Display,
+    file: &str,
+    func: &str,
+    lineno: i64,
+) -> fmt::Result {
+    write!(f, "{} {func}", kind.name())?;
+    if !file.is_empty() {
+        write!(f, " at {file}:{lineno}")?;
+    }
+    match kind {
+        FrameKind::CFrame => write!(f, " ({ip})"),
+        FrameKind::PyFrame => Ok(()),
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_display_call_frame() {
+        let native = CallFrame::CFrame {
+            ip: "0xdeadbeef".to_string(),
+            file: "libfoo.c".to_string(),
+            func: "foo".to_string(),
+            lineno: 12,
+        };
+        let unresolved = CallFrame::CFrame {
+            ip: "0x1".to_string(),
+            file: "".to_string(),
+            func: "bar".to_string(),
+            lineno: 0,
+        };
+        let python = CallFrame::PyFrame {
+            ip: "0x0".to_string(),
+            file: "app.py".to_string(),
+            func: "main".to_string(),
+            lineno: 3,
+        };
+
+        assert_eq!(native.to_string(), "CFrame foo at libfoo.c:12 (0xdeadbeef)");
+        assert_eq!(unresolved.to_string(), "CFrame bar (0x1)");
+        assert_eq!(python.to_string(), "PyFrame main at app.py:3");
+        assert_eq!(native.kind(), FrameKind::CFrame);
+        assert_eq!(python.kind(), FrameKind::PyFrame);
+    }
+}
@@ -0,0 +1,93 @@
+//! Deduplication of sampled stacks.
+//! A profiler collects many samples with identical stacks; storing each distinct stack once
+//! and referring to it by id keeps memory proportional to unique stacks, not samples.
+
+use std::sync::Arc;
+
+use rustc_hash::FxHashMap;
+
+use crate::FrameBatch;
+
+/// Index of a stack stored in a [`StackTable`].
+pub type StackId = u32;
+
+/// Store of distinct stacks, keyed by [`FrameBatch::fingerprint`].
+#[derive(Debug, Default)]
+pub struct StackTable {
+    by_fingerprint: FxHashMap<u64, Vec<StackId>>,
+    stacks: Vec<Arc<FrameBatch>>,
+}
+
+impl StackTable {
+    pub fn new() -> Self {
+        Self::default()
+    }
+
+    /// Number of distinct stacks stored.
+    pub fn len(&self) -> usize {
+        self.stacks.len()
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.stacks.is_empty()
+    }
+
+    /// Return the id of `stack`, storing it if no equal stack was seen before.
+    ///
+    /// Fingerprint collisions fall back to a full comparison, so distinct stacks never
+    /// share an id.
+    pub fn intern(&mut self, stack: FrameBatch) -> StackId {
+        let candidates = self.by_fingerprint.entry(stack.fingerprint()).or_default();
+        if let Some(&id) = candidates
+            .iter()
+            .find(|&&id| *self.stacks[id as usize] == stack)
+        {
+            return id;
+        }
+        let id = StackId::try_from(self.stacks.len()).expect("stack table overflow");
+        candidates.push(id);
+        self.stacks.push(Arc::new(stack));
+        id
+    }
+
+    /// The stack stored under `id`.
+    pub fn get(&self, id: StackId) -> &Arc<FrameBatch> {
+        &self.stacks[id as usize]
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn stack(funcs: &[&str], lineno: i64) -> FrameBatch {
+        let mut batch = FrameBatch::new();
+        for func in funcs {
+            batch.push_cframe("0x0", "", func, lineno);
+        }
+        batch
+    }
+
+    #[test]
+    fn test_identical_stacks_share_id() {
+        let mut table = StackTable::new();
+        let a = table.intern(stack(&["main", "work"], 1));
+        let b = table.intern(stack(&["main", "work"], 1));
+
+        assert_eq!(a, b);
+        assert_eq!(table.len(), 1);
+        assert_eq!(&*table.get(a).func(1), "work");
+    }
+
+    #[test]
+    fn test_distinct_stacks_get_distinct_ids() {
+        let mut table = StackTable::new();
+        let a = table.intern(stack(&["main", "work"], 1));
+        let b = table.intern(stack(&["main", "idle"], 1));
+        let c = table.intern(stack(&["main", "work"], 2));
+
+        assert_ne!(a, b);
+        assert_ne!(a, c);
+        assert_eq!(table.len(), 3);
+    }
+}
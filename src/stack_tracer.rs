@@ -0,0 +1,283 @@
+//! Merge logic for Python + native stacks (prototype).
+//! Contains tests that validate several merging scenarios.
+
+use crate::{CallFrame, FrameBatch};
+
+/// Detect PyEval-like boundaries in a robust manner using substring checks.
+pub(crate) fn is_py_eval(func: &str) -> bool {
+    func.contains("PyEval_EvalFrame")
+        || func.contains("PyEval_EvalCode")
+        || func.starts_with("PyEval")
+        || func.contains("EvalFrameDefault")
+        || func.contains("EvalFrameEx")
+}
+
+/// SignalTracer with merge function (prototype)
+#[derive(Debug)]
+pub struct SignalTracer;
+
+impl SignalTracer {
+    /// Merge python_stacks into native_stacks using heuristic boundaries (PyEval_*).
+    ///
+    /// Rules:
+    /// - Traverse native_stacks in order; for each frame, detect if it's a Python boundary (e.g., PyEval).
+    /// - On Python boundary:
+    ///   * if a python frame is available, consume exactly one python frame and push it into merged (advance index)
+    ///   * otherwise (no python frame available), keep the native frame to avoid losing native context
+    /// - On native frame: push native frame
+    /// - After traversal, append any remaining python frames to merged
+    ///
+    /// Python frames are moved into the result rather than cloned, so merging never
+    /// copies the frame strings.
+    pub fn merge_python_native_stacks(
+        python_stacks: Vec<CallFrame>,
+        native_stacks: Vec<CallFrame>,
+    ) -> Vec<CallFrame> {
+        let mut merged = Vec::with_capacity(native_stacks.len() + python_stacks.len());
+        let mut python_frames = python_stacks.into_iter();
+
+        #[derive(Debug)]
+        enum MergeType {
+            MergeNativeFrame,
+            MergePythonFrame,
+        }
+
+        fn get_merge_strategy(frame: &CallFrame) -> MergeType {
+            if is_py_eval(frame.func()) {
+                MergeType::MergePythonFrame
+            } else {
+                MergeType::MergeNativeFrame
+            }
+        }
+
+        for native_frame in native_stacks.into_iter() {
+            match get_merge_strategy(&native_frame) {
+                MergeType::MergeNativeFrame => merged.push(native_frame),
+                MergeType::MergePythonFrame => match python_frames.next() {
+                    Some(py_frame) => merged.push(py_frame),
+                    // No python frames left: preserve native frame
+                    None => merged.push(native_frame),
+                },
+            }
+        }
+
+        // Append remaining python frames (avoid dropping extra python frames)
+        merged.extend(python_frames);
+
+        merged
+    }
+
+    /// Same rules as [`SignalTracer::merge_python_native_stacks`], applied to
+    /// struct-of-arrays batches.
+    ///
+    /// Two linear passes: first collect the positions of PyEval boundaries from the native
+    /// batch's boundary flag column, then bulk-copy the native columns and overwrite the
+    /// first `min(boundaries, python frames)` boundary rows with python rows. Leftover python
+    /// frames are appended. The flags were filled when the frames were pushed, so no string
+    /// or symbol table is inspected here.
+    pub fn merge_python_native_batches(
+        python_stacks: &FrameBatch,
+        native_stacks: &FrameBatch,
+    ) -> FrameBatch {
+        let boundaries: Vec<usize> = native_stacks
+            .py_eval_flags()
+            .iter()
+            .enumerate()
+            .filter(|&(_, &py_eval)| py_eval)
+            .map(|(i, _)| i)
+            .collect();
+
+        // Each consumed python frame replaces a native row, so the output size is exact.
+        let consumed = boundaries.len().min(python_stacks.len());
+        let mut merged =
+            FrameBatch::with_capacity(native_stacks.len() + python_stacks.len() - consumed);
+        merged.extend_from_rows(native_stacks, 0);
+
+        for (python_frame_index, &row) in boundaries[..consumed].iter().enumerate() {
+            merged.set_row(row, python_stacks, python_frame_index);
+        }
+
+        merged.extend_from_rows(python_stacks, consumed);
+        merged
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::{CallFrame, FrameKind};
+
+    fn cframe(name: &str) -> CallFrame {
+        CallFrame::CFrame {
+            ip: "0x0".to_string(),
+            file: "".to_string(),
+            func: name.to_string(),
+            lineno: 0,
+        }
+    }
+
+    fn pyframe(name: &str) -> CallFrame {
+        CallFrame::PyFrame {
+            ip: "0x0".to_string(),
+            file: "".to_string(),
+            func: name.to_string(),
+            lineno: 0,
+        }
+    }
+
+    fn funcs(frames: &[CallFrame]) -> Vec<String> {
+        frames.iter().map(|f| f.func().to_string()).collect()
+    }
+
+    #[test]
+    fn test_simple_insert() {
+        // native: A -> PyEval -> B
+        // python: py1 -> py2
+        let native = vec![cframe("A"), cframe("PyEval_EvalFrameDefault"), cframe("B")];
+        let python = vec![pyframe("py1"), pyframe("py2")];
+
+        let merged = SignalTracer::merge_python_native_stacks(python, native);
+        let got = funcs(&merged);
+
+        // Expect: A, py1, B, py2
+        assert_eq!(got, vec!["A", "py1", "B", "py2"]);
+    }
+
+    #[test]
+    fn test_python_shortage() {
+        // native: PyEval, PyEval, C
+        // python: only py1
+        let native = vec![
+            cframe("PyEval_EvalFrameDefault"),
+            cframe("PyEval_EvalFrameDefault"),
+            cframe("C"),
+        ];
+        let python = vec![pyframe("py1")];
+
+        let merged = SignalTracer::merge_python_native_stacks(python, native);
+        let got = funcs(&merged);
+
+        // Expect:
+        // first PyEval -> py1
+        // second PyEval -> no python left, keep native PyEval
+        // then C
+        assert_eq!(got, vec!["py1", "PyEval_EvalFrameDefault", "C"]);
+    }
+
+    #[test]
+    fn test_python_extra() {
+        // native has no PyEval, python has frames => all python frames appended
+        let native = vec![cframe("A"), cframe("B")];
+        let python = vec![pyframe("py1"), pyframe("py2")];
+
+        let merged = SignalTracer::merge_python_native_stacks(python, native);
+        let got = funcs(&merged);
+
+        // Expect: A, B, py1, py2
+        assert_eq!(got, vec!["A", "B", "py1", "py2"]);
+    }
+
+    #[test]
+    fn test_no_python_frames() {
+        // native has PyEval markers, but no python frames at all
+        let native = vec![cframe("X"), cframe("PyEval_EvalFrameDefault"), cframe("Y")];
+        let python: Vec<CallFrame> = vec![];
+
+        let merged = SignalTracer::merge_python_native_stacks(python, native);
+        let got = funcs(&merged);
+
+        // Expect: preserve native PyEval since no python frames to insert
+        assert_eq!(got, vec!["X", "PyEval_EvalFrameDefault", "Y"]);
+    }
+
+    fn batch(kind: FrameKind, names: &[&str]) -> FrameBatch {
+        let mut batch = FrameBatch::new();
+        for name in names {
+            match kind {
+                FrameKind::CFrame => batch.push_cframe("0x0", "", name, 0),
+                FrameKind::PyFrame => batch.push_pyframe("0x0", "", name, 0),
+            }
+        }
+        batch
+    }
+
+    fn batch_funcs(batch: &FrameBatch) -> Vec<String> {
+        (0..batch.len())
+            .map(|i| batch.func(i).to_string())
+            .collect()
+    }
+
+    #[test]
+    fn test_batch_merge_matches_frame_merge() {
+        let cases: [(&[&str], &[&str]); 4] = [
+            (&["A", "PyEval_EvalFrameDefault", "B"], &["py1", "py2"]),
+            (
+                &["PyEval_EvalFrameDefault", "PyEval_EvalFrameDefault", "C"],
+                &["py1"],
+            ),
+            (&["A", "B"], &["py1", "py2"]),
+            (&["X", "PyEval_EvalFrameDefault", "Y"], &[]),
+        ];
+
+        for (native, python) in cases {
+            let expected = SignalTracer::merge_python_native_stacks(
+                python.iter().map(|f| pyframe(f)).collect(),
+                native.iter().map(|f| cframe(f)).collect(),
+            );
+            let merged = SignalTracer::merge_python_native_batches(
+                &batch(FrameKind::PyFrame, python),
+                &batch(FrameKind::CFrame, native),
+            );
+
+            assert_eq!(batch_funcs(&merged), funcs(&expected));
+            assert_eq!(merged.capacity(), merged.len());
+        }
+    }
+
+    #[test]
+    fn test_concurrent_batch_merges() {
+        let native = batch(FrameKind::CFrame, &["A", "PyEval_EvalFrameDefault", "B"]);
+        let python = batch(FrameKind::PyFrame, &["py1", "py2"]);
+
+        std::thread::scope(|scope| {
+            let workers: Vec<_> = (0..4)
+                .map(|t| {
+                    let (native, python) = (&native, &python);
+                    scope.spawn(move || {
+                        let mut own = python.clone();
+                        own.push_pyframe("0x0", "", &format!("worker{t}"), 0);
+                        SignalTracer::merge_python_native_batches(&own, native)
+                    })
+                })
+                .collect();
+
+            for (t, worker) in workers.into_iter().enumerate() {
+                let merged = worker.join().unwrap();
+                let worker_name = format!("worker{t}");
+                assert_eq!(
+                    batch_funcs(&merged),
+                    vec!["A", "py1", "B", "py2", worker_name.as_str()]
+                );
+            }
+        });
+    }
+
+    #[test]
+    fn test_batch_merge_keeps_frame_kind() {
+        let native = batch(FrameKind::CFrame, &["A", "PyEval_EvalFrameDefault", "B"]);
+        let python = batch(FrameKind::PyFrame, &["py1", "py2"]);
+
+        let merged = SignalTracer::merge_python_native_batches(&python, &native);
+        let kinds: Vec<FrameKind> = (0..merged.len()).map(|i| merged.kind(i)).collect();
+
+        assert_eq!(
+            kinds,
+            vec![
+                FrameKind::CFrame,
+                FrameKind::PyFrame,
+                FrameKind::CFrame,
+                FrameKind::PyFrame
+            ]
+        );
+    }
+}
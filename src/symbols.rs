@@ -0,0 +1,141 @@
+//! Process-wide symbol table for frame strings.
+//! Native stacks repeat the same file and function names on almost every sample; interning
+//! stores each distinct string once and lets frames carry a `u32` id instead.
+
+use std::sync::{Arc, OnceLock, RwLock, RwLockReadGuard, RwLockWriteGuard};
+
+use rustc_hash::FxHashMap;
+
+use crate::stack_tracer::is_py_eval;
+
+/// Dense index into the process-wide symbol table.
+pub type SymbolId = u32;
+
+/// Interned strings plus per-symbol facts computed once at intern time.
+#[derive(Debug, Default)]
+pub(crate) struct Interner {
+    map: FxHashMap<Arc<str>, SymbolId>,
+    table: Vec<Arc<str>>,
+    py_eval: Vec<bool>,
+}
+
+impl Interner {
+    /// Id of `s` if it has already been interned.
+    pub(crate) fn get(&self, s: &str) -> Option<SymbolId> {
+        self.map.get(s).copied()
+    }
+
+    pub(crate) fn intern(&mut self, s: &str) -> SymbolId {
+        if let Some(&id) = self.map.get(s) {
+            return id;
+        }
+        let id = SymbolId::try_from(self.table.len()).expect("symbol table overflow");
+        let sym: Arc<str> = Arc::from(s);
+        self.map.insert(Arc::clone(&sym), id);
+        self.py_eval.push(is_py_eval(&sym));
+        self.table.push(sym);
+        id
+    }
+
+    pub(crate) fn resolve(&self, id: SymbolId) -> &Arc<str> {
+        &self.table[id as usize]
+    }
+
+    /// Whether the symbol is a Python interpreter boundary (see `is_py_eval`).
+    pub(crate) fn is_py_eval(&self, id: SymbolId) -> bool {
+        self.py_eval[id as usize]
+    }
+}
+
+fn global() -> &'static RwLock<Interner> {
+    static INTERNER: OnceLock<RwLock<Interner>> = OnceLock::new();
+    INTERNER.get_or_init(Default::default)
+}
+
+/// Shared access to the process-wide interner; any number of threads may resolve at once.
+pub(crate) fn reader() -> RwLockReadGuard<'static, Interner> {
+    global().read().unwrap_or_else(|e| e.into_inner())
+}
+
+/// Exclusive access to the process-wide interner; hold the guard across a loop of inserts
+/// rather than locking per frame.
+pub(crate) fn writer() -> RwLockWriteGuard<'static, Interner> {
+    global().write().unwrap_or_else(|e| e.into_inner())
+}
+
+/// Intern `s`, returning its stable id.
+///
+/// Symbols seen before are found under the shared lock; only new symbols take the
+/// exclusive one.
+pub fn intern(s: &str) -> SymbolId {
+    if let Some(id) = reader().get(s) {
+        return id;
+    }
+    writer().intern(s)
+}
+
+/// Intern a function name, also returning whether it is a Python interpreter boundary
+/// (e.g. `PyEval_EvalFrameDefault`). The heuristic runs once per distinct symbol.
+pub(crate) fn intern_func(s: &str) -> (SymbolId, bool) {
+    {
+        let table = reader();
+        if let Some(id) = table.get(s) {
+            return (id, table.is_py_eval(id));
+        }
+    }
+    let mut table = writer();
+    let id = table.intern(s);
+    (id, table.is_py_eval(id))
+}
+
+/// Whether `id` names a Python interpreter boundary frame.
+pub fn is_py_eval_symbol(id: SymbolId) -> bool {
+    reader().is_py_eval(id)
+}
+
+/// Look up the string for an id returned by [`intern`].
+pub fn resolve(id: SymbolId) -> Arc<str> {
+    Arc::clone(reader().resolve(id))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_intern_is_stable() {
+        let a = intern("PyEval_EvalFrameDefault");
+        let b = intern("some_native_func");
+
+        assert_ne!(a, b);
+        assert_eq!(intern("PyEval_EvalFrameDefault"), a);
+        assert_eq!(&*resolve(a), "PyEval_EvalFrameDefault");
+        assert_eq!(&*resolve(b), "some_native_func");
+    }
+
+    #[test]
+    fn test_py_eval_flag_computed_at_intern() {
+        let markers = [
+            "PyEval_EvalFrameDefault",
+            "_PyEval_EvalFrameDefault",
+            "_PyEval_EvalFrame",
+            "PyEval_EvalFrameEx",
+        ];
+        for name in markers {
+            let id = intern(name);
+            assert!(is_py_eval_symbol(id), "{name} not flagged");
+            assert_eq!(&*resolve(id), name);
+        }
+        assert!(!is_py_eval_symbol(intern("do_work")));
+    }
+
+    #[test]
+    fn test_ids_are_dense() {
+        let mut table = Interner::default();
+        let a = table.intern("main.c");
+        let b = table.intern("PyEvalHelpers.c");
+
+        assert_eq!(b, a + 1);
+        assert!((b as usize) < table.table.len());
+    }
+}
@@ -0,0 +1,2 @@
+window.ALL_CRATES = ["mixed_stack_tracer"];
+//{"start":21,"fragment_lengths":[20]}
\ No newline at end of file
@@ -0,0 +1 @@
+window.SIDEBAR_ITEMS = {"enum":["FrameKind"],"fn":["parse_ip"],"struct":["FrameBatch","FrameRef"]};
\ No newline at end of file
@@ -0,0 +1 @@
+window.SIDEBAR_ITEMS = {"constant":["FRAME_CACHE_SLOTS"],"struct":["FrameCache"]};
\ No newline at end of file
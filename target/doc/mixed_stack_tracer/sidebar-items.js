@@ -0,0 +1 @@
+window.SIDEBAR_ITEMS = {"enum":["CallFrame"],"mod":["frame_batch","frame_cache","stack_table","stack_tracer","symbols"]};
\ No newline at end of file
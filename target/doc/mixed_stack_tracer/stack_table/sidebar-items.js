@@ -0,0 +1 @@
+window.SIDEBAR_ITEMS = {"struct":["StackTable"],"type":["StackId"]};
\ No newline at end of file
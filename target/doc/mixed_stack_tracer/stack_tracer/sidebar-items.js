@@ -0,0 +1 @@
+window.SIDEBAR_ITEMS = {"struct":["SignalTracer"]};
\ No newline at end of file
@@ -0,0 +1 @@
+window.SIDEBAR_ITEMS = {"fn":["intern","is_py_eval_symbol","resolve"],"type":["SymbolId"]};
\ No newline at end of file
@@ -0,0 +1,4 @@
+var searchIndex = new Map(JSON.parse('[["mixed_stack_tracer",{"t":"PGEEEEPEEEENNNNNNNNNCCNNNNNNECCCNNNNNOOOOOOOOPFGFPNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNHNNNNNNNNNNNNNNNNNNNSFNNNNNNNNNNIFNNNNNNNNNNNNNNFNNNNNNNNNNIHHH","n":["CFrame","CallFrame","FrameBatch","FrameCache","FrameKind","FrameRef","PyFrame","SignalTracer","StackId","StackTable","SymbolId","borrow","borrow_mut","clone","clone_into","clone_to_uninit","eq","file","fmt","","frame_batch","frame_cache","from","func","into","ip","kind","lineno","parse_ip","stack_table","stack_tracer","symbols","to_owned","to_string","try_from","try_into","type_id","file","","func","","ip","","lineno","","CFrame","FrameBatch","FrameKind","FrameRef","PyFrame","borrow","","","borrow_mut","","","capacity","clone","","","clone_into","","","clone_to_uninit","","","default","eq","","extend_cframes","file","","file_id","","file_ids","fingerprint","fmt","","","","from","","","from_iter","func","","func_id","","func_ids","get","hash","into","","","ip","","ips","is_empty","iter","kind","","kinds","len","lineno","","linenos","name","new","parse_ip","push_cframe","push_cframe_cached","push_pyframe","push_pyframe_cached","to_call_frame","to_owned","","","to_string","try_from","","","try_into","","","type_id","","","with_capacity","FRAME_CACHE_SLOTS","FrameCache","borrow","borrow_mut","default","fmt","from","into","new","try_from","try_into","type_id","StackId","StackTable","borrow","borrow_mut","default","fmt","from","get","intern","into","is_empty","len","new","try_from","try_into","type_id","SignalTracer","borrow","borrow_mut","fmt","from","into","merge_python_native_batches","merge_python_native_stacks","try_from","try_into","type_id","SymbolId","intern","is_py_eval_symbol","resolve"],"q":[[0,"mixed_stack_tracer"],[37,"mixed_stack_tracer::CallFrame"],[45,"mixed_stack_tracer::frame_batch"],[128,"mixed_stack_tracer::frame_cache"],[140,"mixed_stack_tracer::stack_table"],[156,"mixed_stack_tracer::stack_tracer"],[167,"mixed_stack_tracer::symbols"],[171,"core::fmt"],[172,"alloc::string"],[173,"core::result"],[174,"core::any"],[175,"core::convert"],[176,"alloc::sync"],[177,"core::iter::traits::collect"],[178,"core::hash"],[179,"core::iter::traits::exact_size"],[180,"core::ops::function"],[181,"alloc::vec"]],"i":"f`````0````000000000``000000````00000AnB`101010Ad```00BbBf2101210210210121110101121102101101011221010111101110121`1111021012102102101``Cj000000000``Dd0000000000000`Dh000000000````","f":"```````````{b{{b{c}}}{}}{{{b{d}}}{{b{dc}}}{}}{{{b{f}}}f}{{b{b{dc}}}h{}}{{bj}h}{{{b{f}}{b{f}}}l}{{{b{f}}}{{b{n}}}}{{{b{f}}{b{dA`}}}Ab}0``{cc{}}2{{}c{}}3{{{b{f}}}Ad}{{{b{f}}}Af}````{bc{}}{bAh}{c{{Aj{e}}}{}{}}{{}{{Aj{c}}}{}}{bAl}{AnAh}{B`Ah}1010{AnAf}{B`Af}`````{b{{b{c}}}{}}00{{{b{d}}}{{b{dc}}}{}}00{{{b{Bb}}}Bd}{{{b{Ad}}}Ad}{{{b{Bb}}}Bb}{{{b{Bf}}}Bf}{{b{b{dc}}}h{}}00{{bj}h}00{{}Bb}{{{b{Ad}}{b{Ad}}}l}{{{b{Bb}}{b{Bb}}}l}{{{b{dBb}}{b{{Bh{c}}}}{b{{Bh{c}}}}{b{{Bh{c}}}}{b{{Bh{Af}}}}}h{{Bj{n}}}}{{{b{Bb}}Bd}{{Bl{n}}}}{{{b{Bf}}}{{Bl{n}}}}{{{b{Bb}}Bd}Bn}{{{b{Bf}}}Bn}{{{b{Bb}}}{{b{{Bh{Bn}}}}}}{{{b{Bb}}}C`}{{{b{Ad}}{b{dA`}}}Ab}{{{b{Bb}}{b{dA`}}}Ab}0{{{b{Bf}}{b{dA`}}}Ab}{cc{}}00{cBb{{Cd{}{{Cb{{b{f}}}}}}}}:9876{{{b{Bb}}Bd}Bf}{{{b{Ad}}{b{dc}}}hCf}{{}c{}}00{{{b{Bb}}Bd}C`}{{{b{Bf}}}C`}{{{b{Bb}}}{{b{{Bh{C`}}}}}}{{{b{Bb}}}l}{{{b{Bb}}}{{`{{Ch{}{{Cb{Bf}}}}}}}}{{{b{Bb}}Bd}Ad}{{{b{Bf}}}Ad}{{{b{Bb}}}{{b{{Bh{Ad}}}}}}{{{b{Bb}}}Bd}{{{b{Bb}}Bd}Af}{{{b{Bf}}}Af}{{{b{Bb}}}{{b{{Bh{Af}}}}}}{Ad{{b{n}}}}{{}Bb}{{{b{n}}}C`}{{{b{dBb}}{b{n}}{b{n}}{b{n}}Af}h}{{{b{dBb}}{b{dCj}}{b{n}}c}h{{D`{}{{Cl{{Cn{AhAhAf}}}}}}}}1{{{b{dBb}}{b{dCj}}C`Dbc}h{{D`{}{{Cl{{Cn{AhAhAf}}}}}}}}{{{b{Bf}}}f}{bc{}}00{bAh}{c{{Aj{e}}}{}{}}00{{}{{Aj{c}}}{}}00{bAl}00{BdBb}{{}Bd}`{b{{b{c}}}{}}{{{b{d}}}{{b{dc}}}{}}{{}Cj}{{{b{Cj}}{b{dA`}}}Ab}{cc{}}{{}c{}}3:98``54{{}Dd}{{{b{Dd}}{b{dA`}}}Ab}3{{{b{Dd}}Df}{{b{{Bl{Bb}}}}}}{{{b{dDd}}Bb}Df}4{{{b{Dd}}}l}{{{b{Dd}}}Bd}5{c{{Aj{e}}}{}{}}{{}{{Aj{c}}}{}}{bAl}`>={{{b{Dh}}{b{dA`}}}Ab};:{{{b{Bb}}{b{Bb}}}Bb}{{{Dj{f}}{Dj{f}}}{{Dj{f}}}}543`{{{b{n}}}Bn}{Bnl}{Bn{{Bl{n}}}}","D":"H`","p":[[1,"reference",null,null,1],[0,"mut"],[6,"CallFrame",0],[1,"unit"],[1,"u8"],[1,"bool"],[1,"str"],[5,"Formatter",171],[8,"Result",171],[6,"FrameKind",45],[1,"i64"],[5,"String",172],[6,"Result",173,null,1],[5,"TypeId",174],[15,"CFrame",37],[15,"PyFrame",37],[5,"FrameBatch",45],[1,"usize"],[5,"FrameRef",45],[1,"slice"],[10,"AsRef",175],[5,"Arc",176,null,1],[8,"SymbolId",167],[1,"u64"],[17,"Item"],[10,"IntoIterator",177],[10,"Hasher",178],[10,"ExactSizeIterator",179],[5,"FrameCache",128],[17,"Output"],[1,"tuple",null,null,1],[10,"FnOnce",180],[1,"i32"],[5,"StackTable",140],[8,"StackId",140],[5,"SignalTracer",156],[5,"Vec",181]],"r":[[2,45],[3,128],[4,45],[5,45],[7,156],[8,140],[9,140],[10,167],[28,45]],"b":[[18,"impl-Debug-for-CallFrame"],[19,"impl-Display-for-CallFrame"],[77,"impl-Debug-for-FrameBatch"],[78,"impl-Display-for-FrameBatch"]],"c":"OjAAAAAAAAA=","e":"OzAAAAEAAGsAGAABAAAABAAAAAcACgATAAEAIQANADIABgA6AAsARwADAE0AAwBUAAQAWwAAAF8AAQBiAAAAZAABAGcAAgBsAAAAcwANAIMAAwCJAAMAjwADAJcAAACZAAMAngACAKUAAgA=","P":[[11,"T"],[13,""],[14,"T"],[15,""],[22,"T"],[23,""],[24,"U"],[25,""],[32,"T"],[33,""],[34,"U,T"],[35,"U"],[36,""],[50,"T"],[56,""],[60,"T"],[63,""],[69,"S"],[70,""],[80,"T"],[83,"I"],[84,""],[90,"__H"],[91,"U"],[94,""],[110,"F"],[111,""],[112,"F"],[113,""],[114,"T"],[117,""],[118,"U,T"],[121,"U"],[124,""],[130,"T"],[132,""],[134,"T"],[135,"U"],[136,""],[137,"U,T"],[138,"U"],[139,""],[142,"T"],[144,""],[146,"T"],[147,""],[149,"U"],[150,""],[153,"U,T"],[154,"U"],[155,""],[157,"T"],[159,""],[160,"T"],[161,"U"],[162,""],[164,"U,T"],[165,"U"],[166,""]]}]]'));
+if (typeof exports !== 'undefined') exports.searchIndex = searchIndex;
+else if (window.initSearch) window.initSearch(searchIndex);
+//{"start":39,"fragment_lengths":[5581]}
\ No newline at end of file
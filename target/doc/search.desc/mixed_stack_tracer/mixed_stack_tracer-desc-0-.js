@@ -0,0 +1 @@
+searchState.loadedDescShard("mixed_stack_tracer", 0, "mixed-stack-tracer: minimal crate exposing merge …\nA simple CallFrame model used in tests and examples. In …\nPublic re-exports for convenience\nPublic re-exports for convenience\nPublic re-exports for convenience\nSource file, empty when unknown.\nStruct-of-arrays storage for call stacks. Each frame …\nBounded cache of resolved frames keyed by call site. A …\nReturns the argument unchanged.\nFunction (symbol) name.\nCalls <code>U::from(self)</code>.\nInstruction pointer as reported by the collector (e.g. …\nWhich side of the mixed stack this frame came from.\nLine number, 0 when unknown.\nPublic re-exports for convenience\nDeduplication of sampled stacks. A profiler collects many …\nMerge logic for Python + native stacks (prototype). …\nProcess-wide symbol table for frame strings. Native stacks …\nA stack of frames stored column-wise; row <code>i</code> across all …\nWhich side of the mixed stack a frame came from.\nImmutable view of one row of a <code>FrameBatch</code>.\nNumber of frames the batch can hold without reallocating …\nAppend many native frames given as parallel columns.\nFile symbol id column; ids are dense indices into the …\n64-bit hash of the stack’s kinds, ips, symbols and line …\nReturns the argument unchanged.\nReturns the argument unchanged.\nReturns the argument unchanged.\nFunction symbol id column; ids are dense indices into the …\nBorrowed, read-only view of row <code>i</code>.\nCalls <code>U::from(self)</code>.\nCalls <code>U::from(self)</code>.\nCalls <code>U::from(self)</code>.\nInstruction pointer column.\nIterate rows as <code>FrameRef</code> views.\nFrame kind column.\nLine number column.\nDisplay name, matching the <code>CallFrame</code> variant.\nParse a collector-reported instruction pointer such as …\nAppend a native frame.\nAppend the native frame at <code>ip</code>, resolving …\nAppend a Python frame.\nAppend the Python frame executing <code>code_id</code> (i.e. <code>id(code)</code>) …\nMaterialize an owned <code>CallFrame</code> for this row.\nNumber of slots in a <code>FrameCache</code>; must be a power of two.\nDirect-mapped frame cache with <code>FRAME_CACHE_SLOTS</code> entries.\nReturns the argument unchanged.\nCalls <code>U::from(self)</code>.\nIndex of a stack stored in a <code>StackTable</code>.\nStore of distinct stacks, keyed by <code>FrameBatch::fingerprint</code>.\nReturns the argument unchanged.\nThe stack stored under <code>id</code>.\nReturn the id of <code>stack</code>, storing it if no equal stack was …\nCalls <code>U::from(self)</code>.\nNumber of distinct stacks stored.\nSignalTracer with merge function (prototype)\nReturns the argument unchanged.\nCalls <code>U::from(self)</code>.\nSame rules as <code>SignalTracer::merge_python_native_stacks</code>, …\nMerge python_stacks into native_stacks using heuristic …\nDense index into the process-wide symbol table.\nIntern <code>s</code>, returning its stable id.\nWhether <code>id</code> names a Python interpreter boundary frame.\nLook up the string for an id returned by <code>intern</code>.")
\ No newline at end of file
@@ -0,0 +1,2 @@
+createSrcSidebar('[["mixed_stack_tracer",["",[],["frame_batch.rs","frame_cache.rs","lib.rs","stack_table.rs","stack_tracer.rs","symbols.rs"]]]]');
+//{"start":19,"fragment_lengths":[123]}
\ No newline at end of file
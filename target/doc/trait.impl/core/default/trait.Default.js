@@ -0,0 +1,9 @@
+(function() {
+    var implementors = Object.fromEntries([["mixed_stack_tracer",[["impl <a class=\"trait\" href=\"https://doc.rust-lang.org/1.90.0/core/default/trait.Default.html\" title=\"trait core::default::Default\">Default</a> for <a class=\"struct\" href=\"mixed_stack_tracer/frame_batch/struct.FrameBatch.html\" title=\"struct mixed_stack_tracer::frame_batch::FrameBatch\">FrameBatch</a>"],["impl <a class=\"trait\" href=\"https://doc.rust-lang.org/1.90.0/core/default/trait.Default.html\" title=\"trait core::default::Default\">Default</a> for <a class=\"struct\" href=\"mixed_stack_tracer/frame_cache/struct.FrameCache.html\" title=\"struct mixed_stack_tracer::frame_cache::FrameCache\">FrameCache</a>"],["impl <a class=\"trait\" href=\"https://doc.rust-lang.org/1.90.0/core/default/trait.Default.html\" title=\"trait core::default::Default\">Default</a> for <a class=\"struct\" href=\"mixed_stack_tracer/stack_table/struct.StackTable.html\" title=\"struct mixed_stack_tracer::stack_table::StackTable\">StackTable</a>"]]]]);
+    if (window.register_implementors) {
+        window.register_implementors(implementors);
+    } else {
+        window.pending_implementors = implementors;
+    }
+})()
+//{"start":57,"fragment_lengths":[972]}
\ No newline at end of file
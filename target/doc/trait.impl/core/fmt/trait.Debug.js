@@ -0,0 +1,9 @@
+(function() {
+    var implementors = Object.fromEntries([["mixed_stack_tracer",[["impl <a class=\"trait\" href=\"https://doc.rust-lang.org/1.90.0/core/fmt/trait.Debug.html\" title=\"trait core::fmt::Debug\">Debug</a> for <a class=\"enum\" href=\"mixed_stack_tracer/enum.CallFrame.html\" title=\"enum mixed_stack_tracer::CallFrame\">CallFrame</a>"],["impl <a class=\"trait\" href=\"https://doc.rust-lang.org/1.90.0/core/fmt/trait.Debug.html\" title=\"trait core::fmt::Debug\">Debug</a> for <a class=\"enum\" href=\"mixed_stack_tracer/frame_batch/enum.FrameKind.html\" title=\"enum mixed_stack_tracer::frame_batch::FrameKind\">FrameKind</a>"],["impl <a class=\"trait\" href=\"https://doc.rust-lang.org/1.90.0/core/fmt/trait.Debug.html\" title=\"trait core::fmt::Debug\">Debug</a> for <a class=\"struct\" href=\"mixed_stack_tracer/frame_batch/struct.FrameBatch.html\" title=\"struct mixed_stack_tracer::frame_batch::FrameBatch\">FrameBatch</a>"],["impl <a class=\"trait\" href=\"https://doc.rust-lang.org/1.90.0/core/fmt/trait.Debug.html\" title=\"trait core::fmt::Debug\">Debug</a> for <a class=\"struct\" href=\"mixed_stack_tracer/frame_cache/struct.FrameCache.html\" title=\"struct mixed_stack_tracer::frame_cache::FrameCache\">FrameCache</a>"],["impl <a class=\"trait\" href=\"https://doc.rust-lang.org/1.90.0/core/fmt/trait.Debug.html\" title=\"trait core::fmt::Debug\">Debug</a> for <a class=\"struct\" href=\"mixed_stack_tracer/stack_table/struct.StackTable.html\" title=\"struct mixed_stack_tracer::stack_table::StackTable\">StackTable</a>"],["impl <a class=\"trait\" href=\"https://doc.rust-lang.org/1.90.0/core/fmt/trait.Debug.html\" title=\"trait core::fmt::Debug\">Debug</a> for <a class=\"struct\" href=\"mixed_stack_tracer/stack_tracer/struct.SignalTracer.html\" title=\"struct mixed_stack_tracer::stack_tracer::SignalTracer\">SignalTracer</a>"],["impl&lt;'a&gt; <a class=\"trait\" href=\"https://doc.rust-lang.org/1.90.0/core/fmt/trait.Debug.html\" title=\"trait core::fmt::Debug\">Debug</a> for <a class=\"struct\" href=\"mixed_stack_tracer/frame_batch/struct.FrameRef.html\" title=\"struct mixed_stack_tracer::frame_batch::FrameRef\">FrameRef</a>&lt;'a&gt;"]]]]);
+    if (window.register_implementors) {
+        window.register_implementors(implementors);
+    } else {
+        window.pending_implementors = implementors;
+    }
+})()
+//{"start":57,"fragment_lengths":[2117]}
\ No newline at end of file
@@ -0,0 +1,9 @@
+(function() {
+    var implementors = Object.fromEntries([["mixed_stack_tracer",[["impl <a class=\"trait\" href=\"https://doc.rust-lang.org/1.90.0/core/marker/trait.Freeze.html\" title=\"trait core::marker::Freeze\">Freeze</a> for <a class=\"enum\" href=\"mixed_stack_tracer/enum.CallFrame.html\" title=\"enum mixed_stack_tracer::CallFrame\">CallFrame</a>",1,["mixed_stack_tracer::CallFrame"]],["impl <a class=\"trait\" href=\"https://doc.rust-lang.org/1.90.0/core/marker/trait.Freeze.html\" title=\"trait core::marker::Freeze\">Freeze</a> for <a class=\"enum\" href=\"mixed_stack_tracer/frame_batch/enum.FrameKind.html\" title=\"enum mixed_stack_tracer::frame_batch::FrameKind\">FrameKind</a>",1,["mixed_stack_tracer::frame_batch::FrameKind"]],["impl <a class=\"trait\" href=\"https://doc.rust-lang.org/1.90.0/core/marker/trait.Freeze.html\" title=\"trait core::marker::Freeze\">Freeze</a> for <a class=\"struct\" href=\"mixed_stack_tracer/frame_batch/struct.FrameBatch.html\" title=\"struct mixed_stack_tracer::frame_batch::FrameBatch\">FrameBatch</a>",1,["mixed_stack_tracer::frame_batch::FrameBatch"]],["impl <a class=\"trait\" href=\"https://doc.rust-lang.org/1.90.0/core/marker/trait.Freeze.html\" title=\"trait core::marker::Freeze\">Freeze</a> for <a class=\"struct\" href=\"mixed_stack_tracer/frame_cache/struct.FrameCache.html\" title=\"struct mixed_stack_tracer::frame_cache::FrameCache\">FrameCache</a>",1,["mixed_stack_tracer::frame_cache::FrameCache"]],["impl <a class=\"trait\" href=\"https://doc.rust-lang.org/1.90.0/core/marker/trait.Freeze.html\" title=\"trait core::marker::Freeze\">Freeze</a> for <a class=\"struct\" href=\"mixed_stack_tracer/stack_table/struct.StackTable.html\" title=\"struct mixed_stack_tracer::stack_table::StackTable\">StackTable</a>",1,["mixed_stack_tracer::stack_table::StackTable"]],["impl <a class=\"trait\" href=\"https://doc.rust-lang.org/1.90.0/core/marker/trait.Freeze.html\" title=\"trait core::marker::Freeze\">Freeze</a> for <a class=\"struct\" href=\"mixed_stack_tracer/stack_tracer/struct.SignalTracer.html\" title=\"struct mixed_stack_tracer::stack_tracer::SignalTracer\">SignalTracer</a>",1,["mixed_stack_tracer::stack_tracer::SignalTracer"]],["impl&lt;'a&gt; <a class=\"trait\" href=\"https://doc.rust-lang.org/1.90.0/core/marker/trait.Freeze.html\" title=\"trait core::marker::Freeze\">Freeze</a> for <a class=\"struct\" href=\"mixed_stack_tracer/frame_batch/struct.FrameRef.html\" title=\"struct mixed_stack_tracer::frame_batch::FrameRef\">FrameRef</a>&lt;'a&gt;",1,["mixed_stack_tracer::frame_batch::FrameRef"]]]]]);
+    if (window.register_implementors) {
+        window.register_implementors(implementors);
+    } else {
+        window.pending_implementors = implementors;
+    }
+})()
+//{"start":57,"fragment_lengths":[2516]}
\ No newline at end of file
@@ -0,0 +1,9 @@
+(function() {
+    var type_impls = Object.fromEntries([["mixed_stack_tracer",[]]]);
+    if (window.register_type_impls) {
+        window.register_type_impls(type_impls);
+    } else {
+        window.pending_type_impls = type_impls;
+    }
+})()
+//{"start":55,"fragment_lengths":[25]}
\ No newline at end of file